@@ -387,7 +387,16 @@ class Arrow(Composable):
         if other is None:
             return self
         if others:
-            return self.then(other).then(*others)
+            arrows = (self, other) + others
+            if any(not isinstance(f, Arrow) or isinstance(f, self.sum_factory)
+                   for f in arrows):
+                return self.then(other).then(*others)
+            for f, g in zip(arrows, arrows[1:]):
+                assert_isinstance(g, f.factory)
+                assert_isinstance(f, g.factory)
+                assert_iscomposable(f, g)
+            inside = tuple(x for f in arrows for x in f.inside)
+            return self.factory(inside, self.dom, arrows[-1].cod, _scan=False)
         if isinstance(other, self.sum_factory):
             return self.sum_factory((self, )).then(other)
         assert_isinstance(other, self.factory)
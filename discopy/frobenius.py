@@ -27,6 +27,7 @@ Summary
 
 from __future__ import annotations
 from collections.abc import Callable
+from functools import lru_cache
 
 from discopy import compact, pivotal
 from discopy.cat import factory
@@ -170,10 +171,11 @@ class Spider(Box):
                  **params):
         assert_isatomic(typ)
         self.typ = typ
-        data_str = "" if data is None else ", {}".format(data)
-        name = type(self).__name__ + "({}, {}, {}{})".format(
-            n_legs_in, n_legs_out, typ, data_str)
+        data_str = "" if data is None else f", {data}"
+        name = f"{type(self).__name__}({n_legs_in}, {n_legs_out}, {typ}"\
+            f"{data_str})"
         dom, cod = typ ** n_legs_in, typ ** n_legs_out
+        self._n_legs_in, self._n_legs_out = len(dom), len(cod)
         Box.__init__(self, name, dom, cod, data=data, **params)
 
     @property
@@ -182,22 +184,22 @@ class Spider(Box):
         return self.data
 
     def __repr__(self):
-        phase_repr = "" if self.phase is None else ", phase={}".format(
-            repr(self.phase))
-        return factory_name(type(self)) + "({}, {}, {}{})".format(
-            len(self.dom), len(self.cod), repr(self.typ), phase_repr)
+        phase_repr = "" if self.phase is None else f", phase={self.phase!r}"
+        return f"{factory_name(type(self))}({self._n_legs_in}, "\
+            f"{self._n_legs_out}, {self.typ!r}{phase_repr})"
 
     def dagger(self):
         phase = None if self.phase is None else -self.phase
-        return type(self)(len(self.cod), len(self.dom), self.typ, phase)
+        return type(self)(self._n_legs_out, self._n_legs_in, self.typ, phase)
 
     def rotate(self, left=False):
         del left
-        return type(self)(len(self.cod), len(self.dom), self.typ, self.phase)
+        return type(self)(
+            self._n_legs_out, self._n_legs_in, self.typ, self.phase)
 
     def unfuse(self) -> Diagram:
         return coherence(self.factory, type(self))(
-            len(self.dom), len(self.cod), self.typ, self.phase)
+            self._n_legs_in, self._n_legs_out, self.typ, self.phase)
 
 
 class Category(compact.Category):
@@ -225,7 +227,7 @@ class Functor(compact.Functor):
     def __call__(self, other):
         if isinstance(other, Spider):
             return self.cod.ar.spiders(
-                len(other.dom), len(other.cod), self(other.typ))
+                other._n_legs_in, other._n_legs_out, self(other.typ))
         return super().__call__(other)
 
 
@@ -240,18 +242,24 @@ def interleaving(cls: type, factory: Callable
     """
     def method(n_legs_in, n_legs_out, typ, phases=None):
         phases = phases or len(typ) * [None]
-        result = cls.id().tensor(*[
+        spiders = cls.id().tensor(*[
             factory(n_legs_in, n_legs_out, x, p) for x, p in zip(typ, phases)])
+        dom, cod, before, after = spiders.dom, spiders.cod, [], []
         for i, t in enumerate(typ):
             for j in range(n_legs_in - 1):
-                result <<= result.dom[:i * j + i + j] @ cls.swap(
-                    t, result.dom[i * j + i + j:i * n_legs_in + j]
-                ) @ result.dom[i * n_legs_in + j + 1:]
+                swaps = dom[:i * j + i + j] @ cls.swap(
+                    t, dom[i * j + i + j:i * n_legs_in + j]
+                ) @ dom[i * n_legs_in + j + 1:]
+                before.append(swaps)
+                dom = swaps.dom
             for j in range(n_legs_out - 1):
-                result >>= result.cod[:i * j + i + j] @ cls.swap(
-                    result.cod[i * j + i + j:i * n_legs_out + j], t
-                ) @ result.cod[i * n_legs_out + j + 1:]
-        return result
+                swaps = cod[:i * j + i + j] @ cls.swap(
+                    cod[i * j + i + j:i * n_legs_out + j], t
+                ) @ cod[i * n_legs_out + j + 1:]
+                after.append(swaps)
+                cod = swaps.cod
+        first, *rest = before[::-1] + [spiders] + after
+        return first.then(*rest)
 
     return method
 
@@ -273,6 +281,8 @@ def coherence(cls: type, factory: Callable
     Note
     ----
     If the spider has a non-trivial phase then we also output a phase shifter.
+    When ``factory`` is a class, the unfusings of spiders without phase are
+    memoized in a bounded cache.
 
     Example
     -------
@@ -284,23 +294,34 @@ def coherence(cls: type, factory: Callable
             return method(a, 1, x)\
                 >> factory(1, 1, x, phase)\
                 >> method(1, b, x)
-        if (a, b) in [(0, 1), (1, 0), (2, 1), (1, 2)]:
-            return factory(a, b, x)
-        if (a, b) == (1, 1):  # Speciality: one-to-one spiders are identity.
-            return cls.id(x)
-        if a < b:  # Cut the work in two.
-            return method(b, a, x[::-1]).rotate()
-        if b != 1:
-            return method(a, 1, x) >> method(1, b, x)
-        if a % 2:  # We can now assume a is odd and b == 1.
-            return method(a - 1, 1, x) @ x >> factory(2, 1, x)
-        # We can now assume a is even and b == 1.
-        half_spiders = method(a // 2, 1, x)
-        return half_spiders @ half_spiders >> factory(2, 1, x)
+        if isinstance(factory, type):
+            return _cached_unfuse(cls, factory, a, b, x)
+        return _unfuse(cls, factory, method, a, b, x)
 
     return method
 
 
+@lru_cache(maxsize=1024)
+def _cached_unfuse(cls, factory, a, b, x):
+    return _unfuse(cls, factory, coherence(cls, factory), a, b, x)
+
+
+def _unfuse(cls, factory, method, a, b, x):
+    if (a, b) in [(0, 1), (1, 0), (2, 1), (1, 2)]:
+        return factory(a, b, x)
+    if (a, b) == (1, 1):  # Speciality: one-to-one spiders are identity.
+        return cls.id(x)
+    if a < b:  # Cut the work in two.
+        return method(b, a, x[::-1]).rotate()
+    if b != 1:
+        return method(a, 1, x) >> method(1, b, x)
+    if a % 2:  # We can now assume a is odd and b == 1.
+        return method(a - 1, 1, x) @ x >> factory(2, 1, x)
+    # We can now assume a is even and b == 1.
+    half_spiders = method(a // 2, 1, x)
+    return half_spiders @ half_spiders >> factory(2, 1, x)
+
+
 Diagram.cup_factory, Diagram.cap_factory = Cup, Cap
 Diagram.braid_factory, Diagram.spider_factory = Swap, Spider
 
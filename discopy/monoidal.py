@@ -594,12 +594,12 @@ class Diagram(cat.Arrow, Whiskerable):
             dom : The domain of the diagram.
             boxes_and_offsets : The boxes and offsets of the diagram.
         """
-        diagram = cls.id(dom)
+        cod, layers = dom, []
         for box, offset in boxes_and_offsets:
-            left = diagram.cod[:offset]
-            right = diagram.cod[offset + len(box.dom):]
-            diagram = diagram >> left @ box @ right
-        return diagram
+            left, right = cod[:offset], cod[offset + len(box.dom):]
+            layers.append(left @ box @ right)
+            cod = layers[-1].cod
+        return cls.id(dom).then(*layers)
 
     def to_drawing(self):
         """ Called before :meth:`Diagram.draw`. """
@@ -21,6 +21,7 @@ Summary
     Scalar
 """
 
+from functools import lru_cache
 from math import pi
 
 from discopy import messages, cat, rigid, tensor, quantum
@@ -95,40 +96,49 @@ class Diagram(tensor.Diagram):
         ...     6: {4: 1},
         ...     7: {5: 1}}
         """
+        import numpy as np
         from pyzx import Graph, VertexType, EdgeType
-        graph, scan = Graph(), []
+        graph, width = Graph(), len(self.dom)
+        max_width = max([width] + [len(layer.cod) for layer in self.inside])
+        nodes = np.empty(max_width, dtype=np.int32)
+        hadamards = np.zeros(max_width, dtype=bool)
         for i, _ in enumerate(self.dom):
-            node, hadamard = graph.add_vertex(VertexType.BOUNDARY), False
-            scan.append((node, hadamard))
+            node = nodes[i] = graph.add_vertex(VertexType.BOUNDARY)
             graph.set_inputs(graph.inputs() + (node,))
             graph.set_position(node, i, 0)
         for row, (box, offset) in enumerate(zip(self.boxes, self.offsets)):
             if isinstance(box, Spider):
+                n_legs_in, n_legs_out = box._n_legs_in, box._n_legs_out
                 node = graph.add_vertex(
                     VertexType.Z if isinstance(box, Z) else VertexType.X,
                     phase=box.phase * 2 if box.phase else None)
                 graph.set_position(node, offset, row + 1)
-                for i, _ in enumerate(box.dom):
-                    source, hadamard = scan[offset + i]
-                    etype = EdgeType.HADAMARD if hadamard else EdgeType.SIMPLE
-                    graph.add_edge((source, node), etype)
-                scan = scan[:offset] + len(box.cod) * [(node, False)]\
-                    + scan[offset + len(box.dom):]
+                for i in range(offset, offset + n_legs_in):
+                    etype = EdgeType.HADAMARD if hadamards[i]\
+                        else EdgeType.SIMPLE
+                    graph.add_edge((int(nodes[i]), node), etype)
+                new_width = width + n_legs_out - n_legs_in
+                nodes[offset + n_legs_out:new_width]\
+                    = nodes[offset + n_legs_in:width]
+                hadamards[offset + n_legs_out:new_width]\
+                    = hadamards[offset + n_legs_in:width]
+                nodes[offset:offset + n_legs_out] = node
+                hadamards[offset:offset + n_legs_out] = False
+                width = new_width
             elif isinstance(box, Swap):
-                scan = scan[:offset] + [scan[offset + 1], scan[offset]]\
-                    + scan[offset + 2:]
+                swap = [offset + 1, offset]
+                nodes[offset:offset + 2] = nodes[swap]
+                hadamards[offset:offset + 2] = hadamards[swap]
             elif isinstance(box, Scalar):
                 graph.scalar.add_float(box.data)
             elif box == H:
-                node, hadamard = scan[offset]
-                scan[offset] = (node, not hadamard)
+                hadamards[offset] = not hadamards[offset]
             else:
                 raise NotImplementedError
         for i, _ in enumerate(self.cod):
             target = graph.add_vertex(VertexType.BOUNDARY)
-            source, hadamard = scan[i]
-            etype = EdgeType.HADAMARD if hadamard else EdgeType.SIMPLE
-            graph.add_edge((source, target), etype)
+            etype = EdgeType.HADAMARD if hadamards[i] else EdgeType.SIMPLE
+            graph.add_edge((int(nodes[i]), target), etype)
             graph.set_position(target, i, len(self) + 1)
             graph.set_outputs(graph.outputs() + (target,))
         return graph
@@ -269,21 +279,19 @@ class Spider(tensor.Spider, Box):
 
     def subs(self, *args):
         phase = cat.rsubs(self.phase, *args)
-        return type(self)(len(self.dom), len(self.cod), phase=phase)
+        return type(self)(self._n_legs_in, self._n_legs_out, phase=phase)
 
     def grad(self, var, **params):
-        if var not in self.free_symbols:
+        if var not in getattr(self.phase, "free_symbols", ()):
             return Sum((), self.dom, self.cod)
-        gradient = self.phase.diff(var)
-        gradient = complex(gradient) if not gradient.free_symbols else gradient
-        return Scalar(pi * gradient)\
-            @ type(self)(len(self.dom), len(self.cod), self.phase + .5)
+        return _spider_grad(
+            type(self), self._n_legs_in, self._n_legs_out, self.phase, var)
 
     def dagger(self):
-        return type(self)(len(self.cod), len(self.dom), -self.phase)
+        return type(self)(self._n_legs_out, self._n_legs_in, -self.phase)
 
     def rotate(self):
-        return type(self)(len(self.cod), len(self.dom), self.phase)
+        return type(self)(self._n_legs_out, self._n_legs_in, self.phase)
 
     @property
     def array(self):
@@ -335,41 +343,85 @@ def scalar(data):
     return Scalar(data)
 
 
-def gate2zx(box):
-    """ Turns gates into ZX diagrams. """
-    if isinstance(box, (Bra, Ket)):
-        dom, cod = (1, 0) if isinstance(box, Bra) else (0, 1)
-        spiders = [X(dom, cod, phase=.5 * bit) for bit in box.bitstring]
-        return Id().tensor(*spiders) @ scalar(pow(2, -len(box.bitstring) / 2))
-    if isinstance(box, (Rz, Rx)):
-        return (Z if isinstance(box, Rz) else X)(1, 1, box.phase)
-    if isinstance(box, Controlled) and box.name.startswith('CRz'):
-        return Z(1, 2) @ Z(1, 2, box.phase)\
-            >> Id(1) @ (X(2, 1) >> Z(1, 0, -box.phase)) @ Id(1)
-    if isinstance(box, Controlled) and box.name.startswith('CRx'):
-        return X(1, 2) @ X(1, 2, box.phase)\
-            >> Id(1) @ (Z(2, 1) >> X(1, 0, -box.phase)) @ Id(1)
-    if isinstance(box, quantum.CU1):
-        return Z(1, 2, box.phase) @ Z(1, 2, box.phase)\
-            >> Id(1) @ (X(2, 1) >> Z(1, 0, -box.phase)) @ Id(1)
-    if isinstance(box, GatesScalar):
-        if box.is_mixed:
-            raise NotImplementedError
-        return scalar(box.data)
-    if isinstance(box, Controlled) and box.distance != 1:
+@lru_cache(maxsize=1024)
+def _spider_grad(cls, n_legs_in, n_legs_out, phase, var):
+    gradient = phase.diff(var)
+    gradient = complex(gradient) if not gradient.free_symbols else gradient
+    return Scalar(pi * gradient) @ cls(n_legs_in, n_legs_out, phase + .5)
+
+
+def bits2zx(box):
+    """ Turns a bra or a ket into a ZX diagram. """
+    dom, cod = (1, 0) if isinstance(box, Bra) else (0, 1)
+    spiders = Diagram.decode(PRO(dom * len(box.bitstring)), [
+        (X(dom, cod, phase=.5 * bit), 0 if dom else i)
+        for i, bit in enumerate(box.bitstring)])
+    return spiders @ scalar(pow(2, -len(box.bitstring) / 2))
+
+
+def crz2zx(box):
+    """ Turns a controlled Z rotation into a ZX diagram. """
+    return Z(1, 2) @ Z(1, 2, box.phase)\
+        >> Id(1) @ (X(2, 1) >> Z(1, 0, -box.phase)) @ Id(1)
+
+
+def crx2zx(box):
+    """ Turns a controlled X rotation into a ZX diagram. """
+    return X(1, 2) @ X(1, 2, box.phase)\
+        >> Id(1) @ (Z(2, 1) >> X(1, 0, -box.phase)) @ Id(1)
+
+
+def cu12zx(box):
+    """ Turns a controlled U1 rotation into a ZX diagram. """
+    return Z(1, 2, box.phase) @ Z(1, 2, box.phase)\
+        >> Id(1) @ (X(2, 1) >> Z(1, 0, -box.phase)) @ Id(1)
+
+
+def controlled2zx(box):
+    """ Turns a controlled gate into a ZX diagram. """
+    if box.name.startswith('CRz'):
+        return crz2zx(box)
+    if box.name.startswith('CRx'):
+        return crx2zx(box)
+    if box.distance != 1:
         return circuit2zx(box._decompose())
-    standard_gates = {
-        quantum.H: H,
-        quantum.Z: Z(1, 1, .5),
-        quantum.X: X(1, 1, .5),
-        quantum.Y: Z(1, 1, .5) >> X(1, 1, .5) @ scalar(1j),
-        quantum.S: Z(1, 1, .25),
-        quantum.T: Z(1, 1, .125),
-        CZ: Z(1, 2) @ Id(1) >> Id(1) @ H @ Id(1) >> Id(1) @ Z(2, 1),
-        CX: Z(1, 2) @ Id(1) >> Id(1) @ X(2, 1) @ scalar(2 ** 0.5)}
-    return standard_gates[box]
+    return standard_gates()[box]
 
 
+def scalar2zx(box):
+    """ Turns a pure scalar into a ZX diagram. """
+    if box.is_mixed:
+        raise NotImplementedError
+    return scalar(box.data)
+
+
+def gate2zx(box):
+    """
+    Turns gates into ZX diagrams.
+
+    Note
+    ----
+    We dispatch on the first class in the method resolution order of the box
+    that has a handler in :code:`GATE2ZX`, else we look the box up in
+    :func:`standard_gates`.
+    """
+    for cls in type(box).__mro__:
+        if cls in GATE2ZX:
+            return GATE2ZX[cls](box)
+    return standard_gates()[box]
+
+
+GATE2ZX = {
+    Bra: bits2zx,
+    Ket: bits2zx,
+    Rz: lambda box: Z(1, 1, box.phase),
+    Rx: lambda box: X(1, 1, box.phase),
+    CRz: crz2zx,
+    CRx: crx2zx,
+    CU1: cu12zx,
+    Controlled: controlled2zx,
+    GatesScalar: scalar2zx}
+
 circuit2zx = quantum.circuit.Functor(
     ob={qubit: PRO(1)}, ar=gate2zx, cod=Category(PRO, Diagram))
 
@@ -382,3 +434,20 @@ H.color, H.shape = "yellow", "rectangle"
 SWAP = Swap(PRO(1), PRO(1))
 Diagram.braid_factory, Diagram.sum_factory = Swap, Sum
 Id = Diagram.id
+
+
+@lru_cache(maxsize=None)
+def standard_gates():
+    """
+    The ZX diagrams for standard gates, built once on the first call because
+    :code:`quantum.H` etc. are not defined yet when this module is imported.
+    """
+    return {
+        quantum.H: H,
+        quantum.Z: Z(1, 1, .5),
+        quantum.X: X(1, 1, .5),
+        quantum.Y: Z(1, 1, .5) >> X(1, 1, .5) @ scalar(1j),
+        quantum.S: Z(1, 1, .25),
+        quantum.T: Z(1, 1, .125),
+        CZ: Z(1, 2) @ Id(1) >> Id(1) @ H @ Id(1) >> Id(1) @ Z(2, 1),
+        CX: Z(1, 2) @ Id(1) >> Id(1) @ X(2, 1) @ scalar(2 ** 0.5)}
@@ -606,7 +606,8 @@ class Spider(frobenius.Spider, Box):
 
     @property
     def array(self):
-        return Tensor.spiders(len(self.dom), len(self.cod), self.typ).array
+        return Tensor.spiders(
+            self._n_legs_in, self._n_legs_out, self.typ).array
 
 
 class Sum(monoidal.Sum, Box):
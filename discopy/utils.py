@@ -32,17 +32,19 @@ def product(xs: list, unit=1):
     return unit if not xs else product(xs[1:], unit * xs[0])
 
 
-def factory_name(cls: type) -> str:
+def factory_name(cls: type, _cache=dict()) -> str:
     """
-    Returns a string describing a DisCoPy class.
+    Returns a string describing a DisCoPy class, memoized in ``_cache``.
 
     Example
     -------
     >>> from discopy.grammar.pregroup import Word
     >>> assert factory_name(Word) == "grammar.pregroup.Word"
     """
-    return "{}.{}".format(
-        cls.__module__.removeprefix("discopy."), cls.__name__)
+    if cls not in _cache:
+        _cache[cls] = "{}.{}".format(
+            cls.__module__.removeprefix("discopy."), cls.__name__)
+    return _cache[cls]
 
 
 def from_tree(tree: dict):
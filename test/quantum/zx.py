@@ -78,8 +78,10 @@ def test_grad():
     from sympy.abc import phi, psi
     from math import pi
     assert not scalar(phi).grad(psi) and scalar(phi).grad(phi) == scalar(1)
-    assert not Z(1, 1, phi).grad(psi)
+    assert not Z(1, 1, phi).grad(psi) and not Z(1, 1, .5).grad(phi)
     assert Z(1, 1, phi).grad(phi) == scalar(pi) @ Z(1, 1, phi + .5)
+    from discopy.quantum.zx import _spider_grad
+    assert _spider_grad.cache_info().maxsize == 1024
     assert (Z(1, 1, phi / 2) >> Z(1, 1, phi + 1)).grad(phi)\
         == (scalar(pi / 2) @ Z(1, 1, phi / 2 + .5) >> Z(1, 1, phi + 1))\
            + (Z(1, 1, phi / 2) >> scalar(pi) @ PRO(1) >> Z(1, 1, phi + 1.5))
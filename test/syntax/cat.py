@@ -120,8 +120,12 @@ def test_Arrow_then():
     x, y, z = Ob('x'), Ob('y'), Ob('z')
     f, g = Box('f', x, y), Box('g', y, z)
     assert f.then(g) == f >> g == g << f
+    h = Box('h', z, x)
+    assert f.then(g, h) == f >> g >> h
     with raises(TypeError) as err:
         f >> x
+    with raises(AxiomError):
+        f.then(g, f)
 
 
 def test_Arrow_dagger():
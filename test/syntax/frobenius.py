@@ -51,3 +51,17 @@ def test_spider_decomposition():
     assert Spider(5, 1, n).unfuse() == (Spider(2, 1, n) @ Spider(2, 1, n)
                                            @ Id(n) >> Spider(2, 1, n) @ Id(n)
                                            >> Spider(2, 1, n))
+
+
+def test_spider_decomposition_cache():
+    from discopy.frobenius import _cached_unfuse
+    from discopy.quantum.circuit import Circuit, qubit
+    n = Ty('n')
+    assert Spider(3, 4, n).unfuse() == Spider(3, 4, n).unfuse()
+    assert Spider(1, 2, n, 0.5).unfuse()\
+        == Spider(1, 1, n, 0.5) >> Spider(1, 2, n)
+    size = _cached_unfuse.cache_info().currsize
+    for _ in range(10):
+        Circuit.spiders(3, 2, qubit)
+    assert _cached_unfuse.cache_info().currsize == size
+    assert _cached_unfuse.cache_info().maxsize == 1024